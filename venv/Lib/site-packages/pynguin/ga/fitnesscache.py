@@ -0,0 +1,99 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2020 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides a cache for fitness evaluations."""
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import pynguin.configuration as config
+
+if TYPE_CHECKING:
+    import pynguin.ga.chromosome as chrom  # pylint: disable=cyclic-import
+    import pynguin.ga.fitnessfunction as ff  # pylint: disable=cyclic-import
+
+
+class FitnessCache:
+    """A bounded cache for fitness values keyed on chromosome hashes.
+
+    Identical chromosomes recur across generations, e.g., due to elitism or
+    crossover of similar parents; a cache shared between fitness functions lets
+    them reuse previously computed values instead of re-executing.  Each entry
+    keeps a weak reference to the evaluated chromosome to guard against hash
+    collisions, and the least recently used entry is evicted once the capacity
+    is reached.
+    """
+
+    def __init__(self, capacity: Optional[int] = None) -> None:
+        """Create a new fitness cache.
+
+        Args:
+            capacity: The maximum number of entries; falls back to the
+                `fitness_cache_size` configuration value if not given.
+        """
+        self._capacity = (
+            config.INSTANCE.fitness_cache_size if capacity is None else capacity
+        )
+        self._entries: OrderedDict[
+            int, Tuple[weakref.ReferenceType, ff.FitnessValues]
+        ] = OrderedDict()
+
+    def get(self, individual: chrom.Chromosome) -> Optional[ff.FitnessValues]:
+        """Look up the cached fitness values of an individual.
+
+        Args:
+            individual: The individual whose fitness values are requested
+
+        Returns:
+            The cached fitness values, if any
+        """
+        key = hash(individual)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_individual = entry[0]()
+        if cached_individual is None or cached_individual != individual:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, individual: chrom.Chromosome, values: ff.FitnessValues) -> None:
+        """Store the fitness values of an evaluated individual.
+
+        Args:
+            individual: The evaluated individual
+            values: The fitness values to store
+        """
+        key = hash(individual)
+        self._entries[key] = (weakref.ref(individual), values)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def __getstate__(self):
+        """Provides the state for pickling.
+
+        The entries hold weak references, which cannot be pickled; a pickled
+        cache therefore starts out empty.
+
+        Returns:
+            The state without the cached entries
+        """
+        return {"_capacity": self._capacity}
+
+    def __setstate__(self, state) -> None:
+        """Restores a pickled cache with an empty entry table.
+
+        Args:
+            state: The state provided by `__getstate__`
+        """
+        self._capacity = state["_capacity"]
+        self._entries = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,44 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2020 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provides branch distance for test case chromosomes"""
+import pynguin.ga.fitnessfunction as ff
+import pynguin.ga.fitnessfunctions.abstracttestcasefitnessfunction as atcff
+import pynguin.ga.testcasechromosome as tcc
+from pynguin.ga.fitnessfunctions.fitness_utilities import (
+    analyze_results,
+    compute_branch_coverage,
+    compute_branch_distance_fitness,
+)
+from pynguin.testcase.execution.executiontracer import ExecutionTracer
+
+
+class BranchDistanceTestCaseFitnessFunction(atcff.AbstractTestCaseFitnessFunction):
+    """A fitness function based on branch distances and entered code objects."""
+
+    def compute_fitness_values(
+        self, individual: tcc.TestCaseChromosome
+    ) -> ff.FitnessValues:
+        # Only serve from the cache when the individual already carries an
+        # execution result, since a hit skips the executor entirely.
+        if individual.get_last_execution_result() is not None:
+            values = self._cache.get(individual)
+            if values is not None:
+                return values
+
+        result = self._run_test_case_chromosome(individual)
+        merged_trace = analyze_results([result])
+        tracer: ExecutionTracer = self._executor.tracer
+
+        values = ff.FitnessValues(
+            compute_branch_distance_fitness(merged_trace, tracer.get_known_data()),
+            compute_branch_coverage(merged_trace, tracer.get_known_data()),
+        )
+        self._cache.put(individual, values)
+        return values
+
+    def is_maximisation_function(self) -> bool:
+        return False
@@ -0,0 +1,146 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2020 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""Provide abstract selection function."""
+import logging
+import pickle
+from abc import abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Generic, List, TypeVar
+
+import pynguin.configuration as config
+import pynguin.ga.chromosome as chrom
+import pynguin.ga.fitnessfunction as ff
+
+# pylint: disable=invalid-name
+T = TypeVar("T", bound=chrom.Chromosome)
+
+
+def _evaluate(chromosome: T) -> List[ff.FitnessValues]:
+    """Computes the fitness values of a chromosome in a worker process.
+
+    Only the computed values are returned, as the worker's copy of the
+    chromosome is discarded.
+
+    Args:
+        chromosome: The chromosome to evaluate
+
+    Returns:
+        The fitness values, one per fitness function of the chromosome
+    """
+    return [
+        fitness_function.compute_fitness_values(chromosome)
+        for fitness_function in chromosome.get_fitness_functions()
+    ]
+
+
+class SelectionFunction(Generic[T]):
+    """Abstract base class for selection functions."""
+
+    _logger = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self._maximize = True
+
+    @abstractmethod
+    def get_index(self, population: List[T]) -> int:
+        """Provide an index within the population.
+
+        Args:
+            population: A list of chromosomes, the population
+
+        Returns:
+            The index within the population  # noqa: DAR202
+        """
+
+    def prepare(self, population: List[T]) -> None:
+        """Evaluate the fitness of the whole population before selection.
+
+        The individual draws made by `select` then only read cached fitness
+        values.  If `parallel_workers` is greater than one, the changed
+        chromosomes are dispatched to a pool of worker processes in a
+        master-slave fashion; the workers return only the computed fitness
+        values, which are applied to the original chromosomes so that all
+        references into the population stay intact.  Dispatching requires the
+        chromosomes to be picklable; if they are not, for example, because a
+        fitness function holds on to raw code objects, the evaluation falls
+        back to the sequential path.
+
+        Args:
+            population: A list of chromosomes, the population
+        """
+        workers = config.INSTANCE.parallel_workers
+        changed = [
+            chromosome for chromosome in population if chromosome.has_changed()
+        ]
+        if workers > 1 and len(changed) > 1:
+            try:
+                chunk_size = max(1, len(changed) // (4 * workers))
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = executor.map(_evaluate, changed, chunksize=chunk_size)
+                    for chromosome, fitness_values in zip(changed, results):
+                        chromosome.set_fitness_values(fitness_values)
+                return
+            except (
+                pickle.PicklingError,
+                TypeError,
+                AttributeError,
+                BrokenProcessPool,
+            ) as error:
+                self._logger.warning(
+                    "Parallel fitness evaluation failed (%s), falling back to "
+                    "sequential evaluation.",
+                    error,
+                )
+        for chromosome in population:
+            chromosome.get_fitness()
+
+    def get_indices(self, population: List[T], number: int) -> List[int]:
+        """Provide a batch of indices within the population.
+
+        The default implementation draws the indices one by one via
+        `get_index`; subclasses may override this with a draw that computes
+        all indices in a single pass over the population.
+
+        Args:
+            population: A list of chromosomes, the population
+            number: The number of indices to draw
+
+        Returns:
+            A list of indices within the population
+        """
+        return [self.get_index(population) for _ in range(number)]
+
+    def select(self, population: List[T], number: int = 1) -> List[T]:
+        """Return N parents.
+
+        Args:
+            population: A list of chromosomes, the population
+            number: The index to select
+
+        Returns:
+            A list of chromosomes that was selected
+        """
+        return [population[index] for index in self.get_indices(population, number)]
+
+    @property
+    def maximize(self):
+        """Do we maximize fitness?
+
+        Returns:
+            Whether or not this is a maximising fitness function
+        """
+        return self._maximize
+
+    @maximize.setter
+    def maximize(self, new_value: bool) -> None:
+        """Sets whether or not this is a maximising fitness function
+
+        Args:
+            new_value: The new value
+        """
+        self._maximize = new_value
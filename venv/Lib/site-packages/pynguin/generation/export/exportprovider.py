@@ -0,0 +1,57 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2020 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""A generic exporter that selects its export strategy based on configuration."""
+import functools
+from typing import Callable, Dict
+
+import pynguin.configuration as config
+from pynguin.generation.export.abstractexporter import AbstractTestExporter
+from pynguin.generation.export.noneexporter import NoneExporter
+from pynguin.generation.export.pytestexporter import PyTestExporter
+from pynguin.generation.export.unittestexporter import UnitTestExporter
+
+
+# pylint: disable=too-few-public-methods
+class ExportProvider:
+    """Provides the possibility to export generated tests using a configured strategy"""
+
+    _strategies: Dict[config.ExportStrategy, Callable[[bool], AbstractTestExporter]] = {
+        config.ExportStrategy.PY_TEST: PyTestExporter,
+        config.ExportStrategy.UNIT_TEST: UnitTestExporter,
+        config.ExportStrategy.NONE: NoneExporter,
+    }
+
+    @classmethod
+    def get_exporter(cls, wrap_code: bool = False) -> AbstractTestExporter:
+        """Provides an instance of the configured test exporter.
+
+        The flag `wrap_code` indicates whether or not the exported code should be
+        wrapped with a `try`-`except`-block.
+
+        Exporters are stateless apart from the `wrap_code` flag, hence instances
+        are cached and shared between calls.
+
+        Args:
+            wrap_code: Whether or not to wrap the generated code
+
+        Returns:
+            A test-exporter instance
+
+        Raises:
+            Exception: If no appropriate strategy could be found
+        """
+        return cls._cached_exporter(config.INSTANCE.export_strategy, wrap_code)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _cached_exporter(
+        strategy: config.ExportStrategy, wrap_code: bool
+    ) -> AbstractTestExporter:
+        exp = ExportProvider._strategies.get(strategy)
+        if exp is None:
+            raise Exception("Unknown export strategy")
+        return exp(wrap_code)
@@ -0,0 +1,31 @@
+#  This file is part of Pynguin.
+#
+#  SPDX-FileCopyrightText: 2019–2020 Pynguin Contributors
+#
+#  SPDX-License-Identifier: LGPL-3.0-or-later
+#
+"""An exported implementation creating PyTest test cases from the statements."""
+import os
+from typing import List, Union
+
+import pynguin.testcase.testcase as tc
+from pynguin.generation.export.abstractexporter import AbstractTestExporter
+
+
+# pylint: disable=too-few-public-methods
+class PyTestExporter(AbstractTestExporter):
+    """An exporter for PyTest-style test cases."""
+
+    def export_sequences(
+        self, path: Union[str, os.PathLike], test_cases: List[tc.TestCase]
+    ):
+        (
+            module_aliases,
+            common_modules,
+            asts,
+        ) = self._transform_to_asts(test_cases)
+        import_nodes = AbstractTestExporter._create_ast_imports(
+            module_aliases, common_modules
+        )
+        functions = AbstractTestExporter._generate_functions(asts, False)
+        AbstractTestExporter._stream_ast_to_file(path, import_nodes, functions)